@@ -1,11 +1,16 @@
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import click
 import pandas as pd
 
-from deltable.compare import compare_html_tables
-from deltable.rtf_to_html import convert_rtf_to_html
+from deltable.compare import ComparisonResult, compare_html_tables
+from deltable.rtf_to_html import convert_rtf_to_html_batch
+
+# Upper bound on the characters of input paths passed to one soffice
+# call, well below the ~32K command-line limit on Windows.
+_MAX_BATCH_CHARS = 16_000
 
 
 @click.group()
@@ -16,41 +21,150 @@ def cli() -> None:
 @cli.command()
 @click.option("--input", "input_path", required=True, type=click.Path(exists=True))
 @click.option("--output", "output_path", required=True, type=click.Path())
-def compare(input_path: str, output_path: str) -> None:
+@click.option(
+    "--jobs",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of worker processes used to compare pairs.",
+)
+def compare(input_path: str, output_path: str, jobs: int) -> None:
     """Compare table pairs listed in a CSV file.
 
     The input CSV must have ``left_path`` and ``right_path`` columns.
     Each path may point to an ``.html`` or ``.rtf`` file.  RTF files
     are converted to HTML automatically before comparison.
     """
-    pairs = pd.read_csv(input_path)
-    rows: list[dict[str, object]] = []
+    compare_pairs(Path(input_path), Path(output_path), jobs=jobs)
+
+
+def compare_pairs(input_path: Path, output_path: Path, jobs: int = 1) -> None:
+    """Compare the table pairs listed in a CSV file and write the results.
+
+    This is the implementation behind ``deltable compare``.
+
+    Args:
+        input_path: CSV file with ``left_path`` and ``right_path``
+            columns, each pointing to an ``.html`` or ``.rtf`` file.
+        output_path: CSV file to write, with one row per input pair
+            and ``structure_match`` and ``summary`` columns added.
+        jobs: Number of worker processes used to compare pairs.
+    """
+    pairs = pd.read_csv(
+        input_path,
+        usecols=["left_path", "right_path"],
+        dtype=str,
+    )
+    lefts = [Path(path) for path in pairs["left_path"]]
+    rights = [Path(path) for path in pairs["right_path"]]
 
     with tempfile.TemporaryDirectory() as tmp_dir:
         tmp = Path(tmp_dir)
 
-        for _, row in pairs.iterrows():
-            left = Path(row["left_path"])
-            right = Path(row["right_path"])
+        # soffice cannot run several conversions at once, so RTF files
+        # are converted here before the comparisons are fanned out.
+        converted = _convert_rtf_files([*lefts, *rights], tmp)
+        left_htmls = [_ensure_html(path, converted) for path in lefts]
+        right_htmls = [_ensure_html(path, converted) for path in rights]
+        results = _compare_all(left_htmls, right_htmls, jobs)
 
-            left_html = _ensure_html(left, tmp)
-            right_html = _ensure_html(right, tmp)
-
-            result = compare_html_tables(left_html, right_html)
-            rows.append(
-                {
-                    "left_path": str(left),
-                    "right_path": str(right),
-                    "structure_match": result.structure_match,
-                    "summary": result.summary,
-                },
-            )
+        rows = [
+            {
+                "left_path": str(left),
+                "right_path": str(right),
+                "structure_match": result.structure_match,
+                "summary": result.summary,
+            }
+            for left, right, result in zip(lefts, rights, results)
+        ]
 
     pd.DataFrame(rows).to_csv(output_path, index=False)
 
 
-def _ensure_html(path: Path, tmp_dir: Path) -> Path:
-    """Return an HTML path, converting from RTF if needed."""
+def _compare_all(
+    left_htmls: list[Path],
+    right_htmls: list[Path],
+    jobs: int,
+) -> list[ComparisonResult]:
+    """Compare HTML pairs, using a process pool when *jobs* > 1.
+
+    The pool never has more workers than there are pairs.
+
+    Args:
+        left_htmls: Left-hand HTML paths.
+        right_htmls: Right-hand HTML paths, aligned with *left_htmls*.
+        jobs: Number of worker processes.
+
+    Returns:
+        The comparison results in input order.
+    """
+    workers = min(jobs, len(left_htmls))
+    if workers <= 1:
+        return list(map(compare_html_tables, left_htmls, right_htmls))
+
+    # About four chunks per worker keeps every worker busy on small
+    # inputs while still batching the hand-off on large ones.
+    chunksize = max(1, len(left_htmls) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(
+                compare_html_tables,
+                left_htmls,
+                right_htmls,
+                chunksize=chunksize,
+            ),
+        )
+
+
+def _convert_rtf_files(paths: list[Path], tmp_dir: Path) -> dict[Path, Path]:
+    """Convert every distinct RTF file in *paths* to HTML.
+
+    Files are grouped into batches whose names are distinct (ignoring
+    case) and whose paths fit in one command line, and each batch is
+    converted by one ``soffice`` call into its own subdirectory of
+    *tmp_dir*. Usually a single call suffices.
+
+    Args:
+        paths: Input paths; paths that are not ``.rtf`` are ignored.
+        tmp_dir: Directory for converted HTML files.
+
+    Returns:
+        A mapping of resolved RTF paths to converted HTML paths.
+    """
+    rtf_paths = dict.fromkeys(
+        path.resolve() for path in paths if path.suffix.lower() == ".rtf"
+    )
+
+    batches: list[dict[str, Path]] = []
+    batch_chars: list[int] = []
+    for path in rtf_paths:
+        stem = path.stem.lower()
+        chars = len(str(path)) + 1
+        index = next(
+            (
+                index
+                for index, batch in enumerate(batches)
+                if stem not in batch and batch_chars[index] + chars <= _MAX_BATCH_CHARS
+            ),
+            len(batches),
+        )
+        if index == len(batches):
+            batches.append({})
+            batch_chars.append(0)
+        batches[index][stem] = path
+        batch_chars[index] += chars
+
+    converted: dict[Path, Path] = {}
+    for index, batch in enumerate(batches):
+        converted |= convert_rtf_to_html_batch(
+            list(batch.values()),
+            tmp_dir / str(index),
+        )
+    return converted
+
+
+def _ensure_html(path: Path, converted: dict[Path, Path]) -> Path:
+    """Return an HTML path, looking up converted RTF files if needed."""
     if path.suffix.lower() == ".rtf":
-        return convert_rtf_to_html(path, tmp_dir)
+        return converted[path.resolve()]
     return path
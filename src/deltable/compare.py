@@ -1,3 +1,5 @@
+import functools
+import re
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -5,6 +7,9 @@ import pandas as pd
 
 from deltable.error import HtmlComparisonError
 
+# Leading number of a cell, e.g. "12" in "12 (28.6)".
+_LEADING_NUMBER_PATTERN = re.compile(r"^\s*([\d.]+)")
+
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class ComparisonResult:
@@ -57,6 +62,10 @@ def compare_html_tables(
         )
 
     for idx, (left, right) in enumerate(zip(left_tables, right_tables)):
+        # Both sides come from the parse cache when they are the same
+        # file, so identical tables are the same object.
+        if left is right:
+            continue
         mismatch = _check_structure(left, right)
         if mismatch is not None:
             return ComparisonResult(
@@ -87,12 +96,43 @@ def _validate_file_exists(path: Path) -> None:
 def _read_html_tables(path: Path) -> list[pd.DataFrame]:
     """Parse all ``<table>`` elements from an HTML file.
 
+    Parsed tables are cached per file, keyed on the resolved path,
+    modification time, and size, so a file that appears in many
+    comparisons is only parsed once.
+
     Args:
         path: Path to the HTML file.
 
     Returns:
         A list of DataFrames, one per table found.
 
+    Raises:
+        HtmlComparisonError: If no tables can be parsed.
+    """
+    stat = path.stat()
+    return list(_parse_html_tables(path.resolve(), stat.st_mtime_ns, stat.st_size))
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_html_tables(
+    path: Path,
+    mtime_ns: int,
+    size: int,
+) -> tuple[pd.DataFrame, ...]:
+    """Parse all ``<table>`` elements from an HTML file.
+
+    ``pd.read_html`` types plain numeric columns itself. Columns such
+    as ``n (%)`` counts are detected once here with
+    ``_coerce_numeric_columns``, so cached tables carry their types.
+
+    Args:
+        path: Resolved path to the HTML file.
+        mtime_ns: Modification time of the file, used as a cache key.
+        size: Size of the file in bytes, used as a cache key.
+
+    Returns:
+        A tuple of DataFrames, one per table found.
+
     Raises:
         HtmlComparisonError: If no tables can be parsed.
     """
@@ -102,7 +142,7 @@ def _read_html_tables(path: Path) -> list[pd.DataFrame]:
         raise HtmlComparisonError(
             f"Unable to parse HTML tables from {path}.",
         ) from exc
-    return tables
+    return tuple(_coerce_numeric_columns(table) for table in tables)
 
 
 def _check_structure(
@@ -112,21 +152,25 @@ def _check_structure(
     """Return a reason string if structure differs, otherwise None.
 
     Compares column names, row count, column type categories
-    (numeric vs string after coercion), and string-column content
-    with whitespace normalization.  Numeric columns are ignored.
+    (numeric vs string, as detected at load time), and string-column
+    content with whitespace normalization.  Numeric columns are ignored.
 
     Args:
-        left: First table as a DataFrame.
-        right: Second table as a DataFrame.
+        left: First table, with numeric columns already coerced.
+        right: Second table, with numeric columns already coerced.
 
     Returns:
         A short description of the structural mismatch, or None
         when the tables are structurally equivalent.
     """
-    left = left.copy()
-    right = right.copy()
-    left.columns = [_normalize_column_name(c) for c in left.columns]
-    right.columns = [_normalize_column_name(c) for c in right.columns]
+    left = left.set_axis(
+        [_normalize_column_name(c) for c in left.columns],
+        axis="columns",
+    )
+    right = right.set_axis(
+        [_normalize_column_name(c) for c in right.columns],
+        axis="columns",
+    )
 
     if list(left.columns) != list(right.columns):
         return "column mismatch"
@@ -134,23 +178,21 @@ def _check_structure(
     if len(left) != len(right):
         return "row count mismatch"
 
-    left_typed = _coerce_numeric_columns(left)
-    right_typed = _coerce_numeric_columns(right)
-
-    left_cols_numeric = left_typed.select_dtypes(include="number").columns
-    right_cols_numeric = right_typed.select_dtypes(include="number").columns
-    if set(left_cols_numeric) != set(right_cols_numeric):
+    left_cols_numeric = set(left.select_dtypes(include="number").columns)
+    right_cols_numeric = set(right.select_dtypes(include="number").columns)
+    if left_cols_numeric != right_cols_numeric:
         return "column type mismatch"
 
-    str_cols = [c for c in left_typed.columns if c not in left_cols_numeric]
-
-    left_cols_str = left_typed[str_cols].map(_normalize_text, na_action="ignore")
-    right_cols_str = right_typed[str_cols].map(_normalize_text, na_action="ignore")
-
-    if left_cols_str.equals(right_cols_str):
-        return None
+    # Normalize one column at a time so the first difference stops
+    # the scan; all-numeric tables skip this loop entirely.
+    str_cols = [c for c in left.columns if c not in left_cols_numeric]
+    for col in str_cols:
+        left_col = _normalize_text_column(left[col])
+        right_col = _normalize_text_column(right[col])
+        if not left_col.equals(right_col):
+            return "string content differs"
 
-    return "string content differs"
+    return None
 
 
 def _coerce_numeric_columns(df: pd.DataFrame) -> pd.DataFrame:
@@ -161,26 +203,37 @@ def _coerce_numeric_columns(df: pd.DataFrame) -> pd.DataFrame:
             stored as strings.
 
     Returns:
-        A copy of *df* with data columns converted to numeric
-        dtype.
+        *df* itself when no column converts, otherwise a shallow
+        copy of *df* with the converted columns replaced.
     """
-    df_typed = df.copy()
-    for col in df_typed.columns:
+    converted: dict[object, pd.Series] = {}
+    for col in df.columns:
+        # read_html has already typed plain numeric columns. They stay
+        # numeric either way, so skip the astype(str) and regex pass.
+        if pd.api.types.is_numeric_dtype(df[col]):
+            continue
+
         # Try to convert the column to numeric.
         # Extract the leading number to account for 'n (%)' format.
         stripped = (
-            df_typed[col]
+            df[col]
             .astype(str)
             .str.extract(
-                r"^\s*([\d.]+)",
+                _LEADING_NUMBER_PATTERN,
                 expand=False,
             )
         )
         numeric = pd.to_numeric(stripped, errors="coerce")
 
         if numeric.notna().mean() > 0.5:
-            df_typed[col] = numeric
+            converted[col] = numeric
+
+    if not converted:
+        return df
 
+    df_typed = df.copy(deep=False)
+    for name, values in converted.items():
+        df_typed[name] = values
     return df_typed
 
 
@@ -201,6 +254,27 @@ def _normalize_column_name(col: object) -> str | tuple[str, ...]:
     return _normalize_text(str(col))
 
 
+def _normalize_text_column(column: pd.Series) -> pd.Series:
+    """Apply ``_normalize_text`` rules to a whole column at once.
+
+    Uses pandas ``.str`` methods so the work runs per column rather
+    than as one Python call per cell. Missing values stay missing.
+
+    Args:
+        column: A string column from a parsed table.
+
+    Returns:
+        The column as ``string`` dtype with whitespace stripped and
+        collapsed, and all characters lowercased.
+    """
+    return (
+        column.astype("string")
+        .str.strip()
+        .str.lower()
+        .str.replace(r"\s+", " ", regex=True)
+    )
+
+
 def _normalize_text(value: str) -> str:
     """Collapse and strip whitespace for structural comparison.
 
@@ -1,13 +1,18 @@
+import functools
 import shutil
 import subprocess
+from collections.abc import Sequence
 from pathlib import Path
 
 from deltable.error import RtfToHtmlConversionError
 
 
+@functools.cache
 def is_soffice_available() -> bool:
     """Check whether the ``soffice`` command is available on PATH.
 
+    The lookup runs once per process and the result is cached.
+
     Returns:
         True when ``soffice`` can be found, False otherwise.
     """
@@ -33,17 +38,49 @@ def convert_rtf_to_html(input_path: Path, output_dir: Path) -> Path:
             the input file does not exist, has the wrong extension,
             or the conversion process fails.
     """
+    return convert_rtf_to_html_batch([input_path], output_dir)[input_path]
+
+
+def convert_rtf_to_html_batch(
+    input_paths: Sequence[Path],
+    output_dir: Path,
+) -> dict[Path, Path]:
+    """Convert several RTF files to HTML with a single ``soffice`` call.
+
+    Starting LibreOffice dominates the cost of a conversion, so
+    converting files together pays that cost once per batch. Each
+    HTML file is written to *output_dir* as ``<stem>.html``, so the
+    inputs must have distinct stems.
+
+    Args:
+        input_paths: Paths to the ``.rtf`` source files.
+        output_dir: Directory where the HTML outputs are written.
+            Created automatically if it does not exist.
+
+    Returns:
+        A mapping of each input path to its generated HTML file.
+
+    Raises:
+        RtfToHtmlConversionError: If ``soffice`` is unavailable, an
+            input file does not exist or has the wrong extension, two
+            inputs share a stem, or the conversion process fails.
+    """
+    unique_paths = list(dict.fromkeys(input_paths))
+    if not unique_paths:
+        return {}
+
     if not is_soffice_available():
         raise RtfToHtmlConversionError(
             "soffice is not installed or not available on PATH.",
         )
 
-    if not input_path.exists():
-        raise RtfToHtmlConversionError(f"RTF input file does not exist: {input_path}")
+    for input_path in unique_paths:
+        _validate_rtf_input(input_path)
 
-    if input_path.suffix.lower() != ".rtf":
+    stems = [input_path.stem.lower() for input_path in unique_paths]
+    if len(set(stems)) != len(stems):
         raise RtfToHtmlConversionError(
-            f"Expected an .rtf input file, got: {input_path.name}",
+            "RTF inputs converted together must have distinct file names.",
         )
 
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -55,12 +92,12 @@ def convert_rtf_to_html(input_path: Path, output_dir: Path) -> Path:
         "html",
         "--outdir",
         str(output_dir),
-        str(input_path),
+        *(str(input_path) for input_path in unique_paths),
     ]
     completed = subprocess.run(
         command,
-        capture_output=True,
-        text=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
         check=False,
     )
 
@@ -69,6 +106,33 @@ def convert_rtf_to_html(input_path: Path, output_dir: Path) -> Path:
             f"soffice failed with exit code {completed.returncode}."
         )
 
-    output_path = output_dir / f"{input_path.stem}.html"
+    output_paths = {
+        input_path: output_dir / f"{input_path.stem}.html"
+        for input_path in unique_paths
+    }
+    for output_path in output_paths.values():
+        if not output_path.exists():
+            raise RtfToHtmlConversionError(
+                f"soffice did not produce the expected output: {output_path}",
+            )
+
+    return output_paths
+
+
+def _validate_rtf_input(input_path: Path) -> None:
+    """Raise if *input_path* is not an existing ``.rtf`` file.
 
-    return output_path
+    Args:
+        input_path: Path to validate.
+
+    Raises:
+        RtfToHtmlConversionError: If the file does not exist or does
+            not have an ``.rtf`` extension.
+    """
+    if not input_path.exists():
+        raise RtfToHtmlConversionError(f"RTF input file does not exist: {input_path}")
+
+    if input_path.suffix.lower() != ".rtf":
+        raise RtfToHtmlConversionError(
+            f"Expected an .rtf input file, got: {input_path.name}",
+        )
@@ -5,7 +5,7 @@ import pytest
 _DATA_DIR = Path(__file__).parent / "data"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_data_dir() -> Path:
     """Return the path to the test data directory."""
     return _DATA_DIR
@@ -1,16 +1,17 @@
+import csv
 from pathlib import Path
 
-import pandas as pd
+import pytest
 from click.testing import CliRunner
 
-from deltable.cli import cli
+from deltable.cli import _convert_rtf_files, cli, compare_pairs
 
 
-def test_compare_cli(
+def test_compare_pairs(
     test_data_dir: Path,
     tmp_path: Path,
 ) -> None:
-    """Test that the compare CLI works correctly."""
+    """Test that comparing a CSV of pairs works correctly."""
     html_dir = test_data_dir / "html"
     rtf_dir = test_data_dir / "rtf"
 
@@ -21,38 +22,140 @@ def test_compare_cli(
     input_path = tmp_path / "table_paths.csv"
     output_path = tmp_path / "comparison_results.csv"
 
-    pd.DataFrame(
-        {
-            "left_path": [
-                baseline_html,
-                baseline_rtf,
-                baseline_html,
-                baseline_html,
-            ],
-            "right_path": [
-                changed_html,
-                baseline_rtf,
-                baseline_rtf,
-                html_dir / "variants" / "ds_table_minus_1_column.html",
-            ],
-        },
-    ).to_csv(input_path, index=False)
-
-    runner = CliRunner()
-    result = runner.invoke(
-        cli,
-        ["compare", "--input", str(input_path), "--output", str(output_path)],
+    _write_pairs(
+        input_path,
+        [
+            (baseline_html, changed_html),
+            (baseline_rtf, baseline_rtf),
+            (baseline_html, baseline_rtf),
+            (baseline_html, html_dir / "variants" / "ds_table_minus_1_column.html"),
+        ],
     )
 
-    assert result.exit_code == 0
+    compare_pairs(input_path, output_path)
 
-    output_df = pd.read_csv(output_path)
-    assert output_df.columns.tolist() == [
+    rows = _read_results(output_path)
+    assert list(rows[0]) == [
         "left_path",
         "right_path",
         "structure_match",
         "summary",
     ]
-    assert len(output_df) == 4
-    assert output_df["structure_match"].tolist() == [True, True, True, False]
-    assert "structure mismatch" in output_df.loc[3, "summary"]
+    assert len(rows) == 4
+    assert [row["structure_match"] for row in rows] == [
+        "True",
+        "True",
+        "True",
+        "False",
+    ]
+    assert "structure mismatch" in rows[3]["summary"]
+
+
+def test_compare_cli_with_jobs(
+    baseline_dir: Path,
+    variants_dir: Path,
+    tmp_path: Path,
+) -> None:
+    """Test the compare CLI wiring, comparing pairs in parallel."""
+    input_path = tmp_path / "table_paths.csv"
+    output_path = tmp_path / "comparison_results.csv"
+
+    _write_pairs(
+        input_path,
+        [
+            (
+                baseline_dir / "ds_table.html",
+                variants_dir / "ds_table_changed_values.html",
+            ),
+            (
+                baseline_dir / "ds_table.html",
+                variants_dir / "ds_table_minus_1_column.html",
+            ),
+            (
+                baseline_dir / "lb_table.html",
+                variants_dir / "lb_table_minus_1_table.html",
+            ),
+        ],
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli,
+        [
+            "compare",
+            "--input",
+            str(input_path),
+            "--output",
+            str(output_path),
+            "--jobs",
+            "2",
+        ],
+    )
+
+    assert result.exit_code == 0
+
+    rows = _read_results(output_path)
+    assert [row["structure_match"] for row in rows] == ["True", "False", "False"]
+    assert "table count" in rows[2]["summary"]
+
+
+def test_rtf_files_sharing_a_name_are_converted_separately(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that RTF files whose names clash go into separate batches."""
+    calls = _record_batches(monkeypatch)
+    lower = (tmp_path / "a" / "x.rtf").resolve()
+    upper = (tmp_path / "b" / "X.rtf").resolve()
+    out_dir = tmp_path / "out"
+
+    converted = _convert_rtf_files([lower, upper, lower], out_dir)
+
+    assert calls == [([lower], out_dir / "0"), ([upper], out_dir / "1")]
+    assert converted == {
+        lower: out_dir / "0" / "x.html",
+        upper: out_dir / "1" / "X.html",
+    }
+
+
+def test_rtf_batches_are_capped_by_command_length(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that long lists of RTF files are split over several calls."""
+    calls = _record_batches(monkeypatch)
+    paths = [(tmp_path / f"table_{i}.rtf").resolve() for i in range(5)]
+    monkeypatch.setattr("deltable.cli._MAX_BATCH_CHARS", 2 * len(str(paths[0])) + 2)
+
+    converted = _convert_rtf_files(paths, tmp_path / "out")
+
+    assert [batch for batch, _ in calls] == [paths[0:2], paths[2:4], paths[4:]]
+    assert set(converted) == set(paths)
+
+
+def _write_pairs(path: Path, pairs: list[tuple[Path, Path]]) -> None:
+    """Write a pairs CSV with ``left_path`` and ``right_path`` columns."""
+    with path.open("w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(["left_path", "right_path"])
+        writer.writerows(pairs)
+
+
+def _read_results(path: Path) -> list[dict[str, str]]:
+    """Read a results CSV into one dict per row."""
+    with path.open(newline="", encoding="utf-8") as file:
+        return list(csv.DictReader(file))
+
+
+def _record_batches(
+    monkeypatch: pytest.MonkeyPatch,
+) -> list[tuple[list[Path], Path]]:
+    """Replace batch conversion with a stub that records its calls."""
+    calls: list[tuple[list[Path], Path]] = []
+
+    def convert(input_paths: list[Path], output_dir: Path) -> dict[Path, Path]:
+        calls.append((list(input_paths), output_dir))
+        return {path: output_dir / f"{path.stem}.html" for path in input_paths}
+
+    monkeypatch.setattr("deltable.cli.convert_rtf_to_html_batch", convert)
+    return calls
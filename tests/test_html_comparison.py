@@ -94,3 +94,130 @@ def test_raises_when_no_table_found(tmp_path: Path) -> None:
 
     with pytest.raises(HtmlComparisonError, match="Unable to parse HTML tables"):
         compare_html_tables(left, right)
+
+
+def test_spanned_cells_match_repeated_cells(tmp_path: Path) -> None:
+    spanned = tmp_path / "spanned.html"
+    repeated = tmp_path / "repeated.html"
+    spanned.write_text(
+        "<table>"
+        "<tr><th colspan='2'>Group</th></tr>"
+        "<tr><td rowspan='2'>A</td><td>x</td></tr>"
+        "<tr><td>y</td></tr>"
+        "</table>\n",
+        encoding="utf-8",
+    )
+    repeated.write_text(
+        "<table>"
+        "<tr><th>Group</th><th>Group</th></tr>"
+        "<tr><td>A</td><td>x</td></tr>"
+        "<tr><td>A</td><td>y</td></tr>"
+        "</table>\n",
+        encoding="utf-8",
+    )
+
+    result = compare_html_tables(spanned, repeated)
+
+    assert result.structure_match is True
+
+
+def test_rowspan_past_last_row_adds_rows(tmp_path: Path) -> None:
+    spanned = tmp_path / "spanned.html"
+    single = tmp_path / "single.html"
+    spanned.write_text(
+        "<table><tr><th>Group</th></tr><tr><td rowspan='3'>A</td></tr></table>\n",
+        encoding="utf-8",
+    )
+    single.write_text(
+        "<table><tr><th>Group</th></tr><tr><td>A</td></tr></table>\n",
+        encoding="utf-8",
+    )
+
+    result = compare_html_tables(spanned, single)
+
+    assert result.structure_match is False
+    assert "row count mismatch" in result.summary
+
+
+def test_line_breaks_match_spaces(tmp_path: Path) -> None:
+    broken = tmp_path / "broken.html"
+    spaced = tmp_path / "spaced.html"
+    broken.write_text(
+        "<table><tr><th>Sample X<br>(N=42)</th></tr><tr><td>a<br>b</td></tr></table>\n",
+        encoding="utf-8",
+    )
+    spaced.write_text(
+        "<table><tr><th>Sample X (N=42)</th></tr><tr><td>a b</td></tr></table>\n",
+        encoding="utf-8",
+    )
+
+    result = compare_html_tables(broken, spaced)
+
+    assert result.structure_match is True, result.summary
+
+
+@pytest.mark.parametrize(
+    ("left_values", "right_values"),
+    [
+        (["-1.5", "-2"], ["-3.1", "-4"]),
+        (["-1.5", "-2", "3"], ["2.5", "-4", "-1"]),
+        (["", "", "3"], ["", "", "5"]),
+        (["NA", "1"], ["N/A", "2"]),
+    ],
+    ids=["negative", "mixed_sign", "sparse", "na_markers"],
+)
+def test_numeric_value_differences_ignored(
+    left_values: list[str],
+    right_values: list[str],
+    tmp_path: Path,
+) -> None:
+    left = tmp_path / "left.html"
+    right = tmp_path / "right.html"
+    _write_column(left, "Change", left_values)
+    _write_column(right, "Change", right_values)
+
+    result = compare_html_tables(left, right)
+
+    assert result.structure_match is True, result.summary
+
+
+def test_reparses_file_after_it_changes(tmp_path: Path) -> None:
+    left = tmp_path / "left.html"
+    right = tmp_path / "right.html"
+    left.write_text("<table><tr><td>a</td></tr></table>\n", encoding="utf-8")
+    right.write_text("<table><tr><td>a</td></tr></table>\n", encoding="utf-8")
+
+    assert compare_html_tables(left, right).structure_match is True
+
+    right.write_text(
+        "<table><tr><td>a</td><td>b</td></tr></table>\n",
+        encoding="utf-8",
+    )
+
+    assert compare_html_tables(left, right).structure_match is False
+
+
+def test_numeric_only_tables_match(tmp_path: Path) -> None:
+    left = tmp_path / "left.html"
+    right = tmp_path / "right.html"
+    left.write_text(
+        "<table><tr><th>n</th></tr><tr><td>1</td></tr><tr><td>2</td></tr></table>\n",
+        encoding="utf-8",
+    )
+    right.write_text(
+        "<table><tr><th>n</th></tr><tr><td>3</td></tr><tr><td>4</td></tr></table>\n",
+        encoding="utf-8",
+    )
+
+    result = compare_html_tables(left, right)
+
+    assert result.structure_match is True
+
+
+def _write_column(path: Path, name: str, values: list[str]) -> None:
+    """Write a one-column HTML table with a ``<th>`` header row."""
+    rows = "".join(f"<tr><td>{value}</td></tr>" for value in values)
+    path.write_text(
+        f"<table><tr><th>{name}</th></tr>{rows}</table>\n",
+        encoding="utf-8",
+    )
@@ -3,34 +3,69 @@ from pathlib import Path
 import pytest
 
 from deltable.compare import compare_html_tables
+from deltable.error import RtfToHtmlConversionError
 from deltable.rtf_to_html import (
     convert_rtf_to_html,
+    convert_rtf_to_html_batch,
     is_soffice_available,
 )
 
 
-@pytest.mark.parametrize(
-    "fixture_name",
-    [
-        "ds_table",
-        "frq_table",
-        "lb_table",
-        "surv_table",
-    ],
-)
+_FIXTURE_NAMES = ["ds_table", "frq_table", "lb_table", "surv_table"]
+
+
+@pytest.fixture(scope="module")
+def converted_fixtures(
+    test_data_dir: Path,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> dict[str, Path]:
+    """Convert every RTF fixture in one soffice call, keyed by stem."""
+    rtf_paths = [test_data_dir / "rtf" / f"{name}.rtf" for name in _FIXTURE_NAMES]
+    converted = convert_rtf_to_html_batch(
+        rtf_paths,
+        tmp_path_factory.mktemp("converted"),
+    )
+    return {rtf_path.stem: html_path for rtf_path, html_path in converted.items()}
+
+
+@pytest.mark.parametrize("fixture_name", _FIXTURE_NAMES)
 @pytest.mark.skipif(not is_soffice_available(), reason="soffice is unavailable")
 def test_convert_rtf_fixtures_match_saved_html(
     fixture_name: str,
+    converted_fixtures: dict[str, Path],
     test_data_dir: Path,
-    tmp_path: Path,
 ) -> None:
-    rtf_path = test_data_dir / "rtf" / f"{fixture_name}.rtf"
     expected_html_path = test_data_dir / "html" / "baseline" / f"{fixture_name}.html"
 
+    generated_html_path = converted_fixtures[fixture_name]
+
+    result = compare_html_tables(generated_html_path, expected_html_path)
+    assert result.structure_match, result.summary
+
+
+@pytest.mark.skipif(not is_soffice_available(), reason="soffice is unavailable")
+def test_convert_single_rtf_file(test_data_dir: Path, tmp_path: Path) -> None:
+    rtf_path = test_data_dir / "rtf" / "ds_table.rtf"
+
     generated_html_path = convert_rtf_to_html(
         input_path=rtf_path,
         output_dir=tmp_path,
     )
 
-    result = compare_html_tables(generated_html_path, expected_html_path)
-    assert result.structure_match, result.summary
+    assert generated_html_path == tmp_path / "ds_table.html"
+    assert generated_html_path.exists()
+
+
+@pytest.mark.skipif(not is_soffice_available(), reason="soffice is unavailable")
+def test_batch_conversion_rejects_duplicate_stems(
+    test_data_dir: Path,
+    tmp_path: Path,
+) -> None:
+    rtf_path = test_data_dir / "rtf" / "ds_table.rtf"
+    copy_dir = tmp_path / "copy"
+    copy_dir.mkdir()
+    copied_rtf_path = copy_dir / "DS_TABLE.rtf"
+    copied_rtf_path.write_bytes(rtf_path.read_bytes())
+
+    with pytest.raises(RtfToHtmlConversionError, match="distinct file names"):
+        convert_rtf_to_html_batch([rtf_path, copied_rtf_path], tmp_path / "out")